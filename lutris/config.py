@@ -236,7 +236,10 @@ class LutrisConfig:
         defaults = {}
         for option, params in options_dict.items():
             if "default" in params:
-                defaults[option] = params["default"]
+                default = params["default"]
+                if callable(default):
+                    default = default()
+                defaults[option] = default
         return defaults
 
     def options_as_dict(self, options_type):
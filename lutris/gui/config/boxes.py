@@ -86,6 +86,8 @@ class ConfigBox(VBox):
                 option["choices"] = option["choices"]()
             if callable(option.get("condition")):
                 option["condition"] = option["condition"]()
+            if callable(option.get("default")):
+                option["default"] = option["default"]()
 
             self.wrapper = Gtk.Box()
             self.wrapper.set_spacing(12)
@@ -652,9 +654,10 @@ class SystemBox(ConfigBox):
         runner_slug = self.lutris_config.runner_slug
 
         if runner_slug:
-            self.options = sysoptions.with_runner_overrides(runner_slug)
+            options = sysoptions.with_runner_overrides(runner_slug)
         else:
-            self.options = sysoptions.system_options
+            options = sysoptions.system_options
+        self.options = [sysoptions.translate_option(option) for option in options]
 
         if lutris_config.game_config_id and runner_slug:
             self.generate_top_info_box(_(
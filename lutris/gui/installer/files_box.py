@@ -1,4 +1,6 @@
-from gi.repository import GObject, Gtk
+from itertools import islice
+
+from gi.repository import GLib, GObject, Gtk
 
 from lutris.gui.installer.file_box import InstallerFileBox
 from lutris.util.log import logger
@@ -8,6 +10,7 @@ class InstallerFilesBox(Gtk.ListBox):
     """List box presenting all files needed for an installer"""
 
     max_downloads = 3
+    populate_batch_size = 16
 
     __gsignals__ = {
         "files-ready": (GObject.SIGNAL_RUN_LAST, None, (bool, )),
@@ -23,18 +26,44 @@ class InstallerFilesBox(Gtk.ListBox):
         self.available_files = set()
         self.installer_files_boxes = {}
         self._file_queue = []
-        for installer_file in installer.files:
+        self._populate_source_id = None
+        self.connect("destroy", self.on_destroy)
+        self.show_all()
+
+    def iter_file_boxes(self):
+        """Add a box for each installer file, yielding after each one"""
+        for installer_file in self.installer_files:
             installer_file_box = InstallerFileBox(installer_file)
             installer_file_box.connect("file-ready", self.on_file_ready)
             installer_file_box.connect("file-unready", self.on_file_unready)
             installer_file_box.connect("file-available", self.on_file_available)
             self.installer_files_boxes[installer_file.id] = installer_file_box
             self.add(installer_file_box)
+            installer_file_box.show_all()
             if installer_file_box.is_ready:
                 self.ready_files.add(installer_file.id)
-        self.show_all()
+            yield installer_file_box
         self.check_files_ready()
 
+    def populate(self):
+        """Add the installer file boxes in batches when idle so the
+        window gets drawn without waiting for all of them"""
+        file_boxes = self.iter_file_boxes()
+
+        def add_file_boxes():
+            if len(list(islice(file_boxes, self.populate_batch_size))) < self.populate_batch_size:
+                self._populate_source_id = None
+                return False
+            return True
+
+        self._populate_source_id = GLib.idle_add(add_file_boxes)
+
+    def on_destroy(self, _widget):
+        """Stop adding file boxes once the list is gone"""
+        if self._populate_source_id:
+            GLib.source_remove(self._populate_source_id)
+            self._populate_source_id = None
+
     def start_all(self):
         """Iterates through installer files while keeping the number
         of simultaneously downloaded files down to a maximum number"""
@@ -22,6 +22,16 @@ from lutris.util.steam import shortcut as steam_shortcut
 from lutris.util.strings import add_url_tags, gtk_safe, human_size
 from lutris.util.system import is_removeable
 
+_VDF_EXISTS = None
+
+
+def steam_vdf_file_exists():
+    """Return whether a Steam shortcuts file is available, checked once per process"""
+    global _VDF_EXISTS
+    if _VDF_EXISTS is None:
+        _VDF_EXISTS = steam_shortcut.vdf_file_exists()
+    return _VDF_EXISTS
+
 
 class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public-methods
     """GUI for the install process."""
@@ -37,11 +47,13 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
         super().__init__(application=application)
         self.set_default_size(540, 320)
         self.installers = installers
+        self._installers_by_version = {}
         self.config = {}
         self.service = service
         self.appid = appid
         self.install_in_progress = False
         self.interpreter = None
+        self._system_config = None
         self.is_update = is_update
         self.log_buffer = None
         self.log_textview = None
@@ -61,6 +73,35 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
         self.widget_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self.vbox.pack_start(self.widget_box, True, True, 0)
 
+        # Widgets reused across stages, clean_widgets() hides them instead of destroying them
+        self.message_label = InstallerLabel()
+        self.message_label.set_no_show_all(True)
+        self.widget_box.pack_start(self.message_label, False, False, 18)
+
+        self.desktop_shortcut_button = Gtk.CheckButton(_("Create desktop shortcut"), no_show_all=True)
+        self.desktop_shortcut_button.connect("clicked", self.on_create_desktop_shortcut_clicked)
+        self.widget_box.pack_start(self.desktop_shortcut_button, False, False, 5)
+
+        self.menu_shortcut_button = Gtk.CheckButton(_("Create application menu shortcut"), no_show_all=True)
+        self.menu_shortcut_button.connect("clicked", self.on_create_menu_shortcut_clicked)
+        self.widget_box.pack_start(self.menu_shortcut_button, False, False, 5)
+
+        self.steam_shortcut_button = Gtk.CheckButton(_("Create steam shortcut"), no_show_all=True)
+        self.steam_shortcut_button.connect("clicked", self.on_create_steam_shortcut_clicked)
+        self.widget_box.pack_start(self.steam_shortcut_button, False, False, 5)
+
+        self.installer_files_window = Gtk.ScrolledWindow(hexpand=True, vexpand=True, no_show_all=True)
+        self.installer_files_window.set_shadow_type(Gtk.ShadowType.ETCHED_IN)
+        self.widget_box.pack_end(self.installer_files_window, True, True, 10)
+
+        self._persistent_widgets = {
+            self.message_label,
+            self.desktop_shortcut_button,
+            self.menu_shortcut_button,
+            self.steam_shortcut_button,
+            self.installer_files_window,
+        }
+
         self.vbox.add(Gtk.HSeparator())
 
         button_box = Gtk.Box()
@@ -68,10 +109,8 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
         self.cache_button.connect("clicked", self.on_cache_clicked)
         button_box.add(self.cache_button)
 
-        self.action_buttons = Gtk.Box(spacing=6)
-        action_buttons_alignment = Gtk.Alignment.new(1, 0, 0, 0)
-        action_buttons_alignment.add(self.action_buttons)
-        button_box.pack_end(action_buttons_alignment, True, True, 0)
+        self.action_buttons = Gtk.Box(spacing=6, halign=Gtk.Align.END, valign=Gtk.Align.START)
+        button_box.pack_end(self.action_buttons, True, True, 0)
         self.vbox.pack_start(button_box, False, True, 0)
 
         self.cancel_button = self.add_button(
@@ -122,6 +161,7 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
                 if item not in script:
                     logger.error("Invalid script: %s", script)
                     raise ScriptingError(_('Missing field "%s" in install script') % item)
+        self._installers_by_version = {script["version"]: script for script in self.installers}
 
     def choose_installer(self):
         """Stage where we choose an install script."""
@@ -152,11 +192,9 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
         """
         self.clean_widgets()
         try:
-            script = None
-            for _script in self.installers:
-                if _script["version"] == installer_version:
-                    script = _script
+            script = self._installers_by_version.get(installer_version)
             self.interpreter = interpreter.ScriptInterpreter(script, self)
+            self._system_config = LutrisConfig().system_config
 
         except MissingGameDependency as ex:
             dlg = QuestionDialog(
@@ -174,21 +212,16 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
                 )
             self.destroy()
             return
-        self.title_label.set_markup(_("<b>Installing {}</b>").format(gtk_safe(self.interpreter.installer.game_name)))
+        self.title_label.set_markup(_("<b>Installing {}</b>").format(self.interpreter.installer.safe_game_name))
         self.select_install_folder()
 
-        desktop_shortcut_button = Gtk.CheckButton(_("Create desktop shortcut"), visible=True)
-        desktop_shortcut_button.connect("clicked", self.on_create_desktop_shortcut_clicked)
-        self.widget_box.pack_start(desktop_shortcut_button, False, False, 5)
-
-        menu_shortcut_button = Gtk.CheckButton(_("Create application menu shortcut"), visible=True)
-        menu_shortcut_button.connect("clicked", self.on_create_menu_shortcut_clicked)
-        self.widget_box.pack_start(menu_shortcut_button, False, False, 5)
-
-        if steam_shortcut.vdf_file_exists():
-            steam_shortcut_button = Gtk.CheckButton(_("Create steam shortcut"), visible=True)
-            steam_shortcut_button.connect("clicked", self.on_create_steam_shortcut_clicked)
-            self.widget_box.pack_start(steam_shortcut_button, False, False, 5)
+        shortcut_buttons = [self.desktop_shortcut_button, self.menu_shortcut_button]
+        if steam_vdf_file_exists():
+            shortcut_buttons.append(self.steam_shortcut_button)
+        for shortcut_button in shortcut_buttons:
+            # Keep the shortcut options below the widgets of the current stage
+            self.widget_box.reorder_child(shortcut_button, -1)
+            shortcut_button.show()
 
     def select_install_folder(self):
         """Stage where we select the install directory."""
@@ -324,14 +357,12 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
         installer_files_box.connect("files-available", self.on_files_available)
         installer_files_box.connect("files-ready", self.on_files_ready)
         self._cancel_files_func = installer_files_box.stop_all
-        scrolledwindow = Gtk.ScrolledWindow(
-            hexpand=True,
-            vexpand=True,
-            child=installer_files_box,
-            visible=True
-        )
-        scrolledwindow.set_shadow_type(Gtk.ShadowType.ETCHED_IN)
-        self.widget_box.pack_end(scrolledwindow, True, True, 10)
+        previous_files_box = self.installer_files_window.get_child()
+        if previous_files_box:
+            previous_files_box.destroy()
+        self.installer_files_window.add(installer_files_box)
+        self.installer_files_window.show()
+        installer_files_box.populate()
 
         self.continue_button.show()
         self.continue_button.set_sensitive(installer_files_box.is_ready)
@@ -365,13 +396,24 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
             bool,  # is inconsistent?
             str,   # id
             str,   # label
+            int,   # number of selected extras (headings only)
+            int,   # number of extras (headings only)
         )
-        for extra_source, extras in all_extras.items():
-            parent = extra_treestore.append(None, (None, None, None, extra_source))
-            for extra in extras:
-                extra_treestore.append(parent, (False, False, extra["id"], self.get_extra_label(extra)))
-
-        treeview = Gtk.TreeView(extra_treestore)
+        # Compute labels beforehand and fill the model while it's not attached
+        # to any view, so rows don't trigger view updates as they are inserted.
+        extra_rows = [
+            (extra_source, [(extra["id"], self.get_extra_label(extra)) for extra in extras])
+            for extra_source, extras in all_extras.items()
+        ]
+        treeview = Gtk.TreeView()
+        treeview.freeze_child_notify()
+        treeview.set_model(None)
+        for extra_source, extras in extra_rows:
+            parent = extra_treestore.append(None, (None, None, None, extra_source, 0, len(extras)))
+            for extra_id, extra_label in extras:
+                extra_treestore.append(parent, (False, False, extra_id, extra_label, 0, 0))
+        treeview.set_model(extra_treestore)
+        treeview.thaw_child_notify()
         treeview.set_headers_visible(False)
         treeview.expand_all()
         renderer_toggle = Gtk.CellRendererToggle()
@@ -414,34 +456,31 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
                 extra_row = model[extra_iter]
                 extra_row[0] = toggled_row[0]
                 extra_iter = model.iter_next(extra_iter)
+            toggled_row[4] = toggled_row[5] if toggled_row[0] else 0
         else:
-            for heading_row in model:
-                all_extras_active = True
-                any_extras_active = False
-                extra_iter = model.iter_children(heading_row.iter)
-                while extra_iter:
-                    extra_row = model[extra_iter]
-                    if extra_row[0]:
-                        any_extras_active = True
-                    else:
-                        all_extras_active = False
-                    extra_iter = model.iter_next(extra_iter)
-
-                heading_row[0] = all_extras_active
-                heading_row[1] = any_extras_active
+            # Headings keep a count of their selected extras, no need to rescan them
+            heading_row = model[model.iter_parent(toggled_row_iter)]
+            heading_row[4] += 1 if toggled_row[0] else -1
+            selected_count, total_count = heading_row[4], heading_row[5]
+            heading_row[0] = selected_count == total_count
+            heading_row[1] = 0 < selected_count < total_count
 
     def on_extras_confirmed(self, _button, extra_store):
         """Resume install when user has selected extras to download"""
         selected_extras = []
-
-        def save_extra(store, path, iter_):
-            selected, _inconsistent, id_, _label = store[iter_]
-            if selected and id_:
-                selected_extras.append(id_)
-        extra_store.foreach(save_extra)
+        heading_iter = extra_store.get_iter_first()
+        while heading_iter:
+            extra_iter = extra_store.iter_children(heading_iter)
+            while extra_iter:
+                if extra_store.get_value(extra_iter, 0):
+                    id_ = extra_store.get_value(extra_iter, 2)
+                    if id_:
+                        selected_extras.append(id_)
+                extra_iter = extra_store.iter_next(extra_iter)
+            heading_iter = extra_store.iter_next(heading_iter)
 
         self.interpreter.extras = selected_extras
-        GLib.idle_add(self.on_runners_ready)
+        self.on_runners_ready()
 
     def on_files_ready(self, _widget, files_ready):
         """Toggle state of continue button based on ready state"""
@@ -557,7 +596,7 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
 
         remove_checkbox = Gtk.CheckButton.new_with_label(_("Remove game files"))
         if self.interpreter and self.interpreter.target_path and \
-                is_removeable(self.interpreter.target_path, LutrisConfig().system_config):
+                is_removeable(self.interpreter.target_path, self._system_config):
             remove_checkbox.set_active(self.interpreter.game_dir_created)
             remove_checkbox.show()
             widgets.append(remove_checkbox)
@@ -590,7 +629,10 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
     def clean_widgets(self):
         """Cleanup before displaying the next stage."""
         for child_widget in self.widget_box.get_children():
-            child_widget.destroy()
+            if child_widget in self._persistent_widgets:
+                child_widget.hide()
+            else:
+                child_widget.destroy()
 
     def set_status(self, text):
         """Display a short status text."""
@@ -598,10 +640,8 @@ class InstallerWindow(BaseApplicationWindow):  # pylint: disable=too-many-public
 
     def set_message(self, message):
         """Display a message."""
-        label = InstallerLabel()
-        label.set_markup("<b>%s</b>" % add_url_tags(message))
-        label.show()
-        self.widget_box.pack_start(label, False, False, 18)
+        self.message_label.set_markup("<b>%s</b>" % add_url_tags(message))
+        self.message_label.show()
 
     def add_spinner(self):
         """Show a spinner in the middle of the view"""
@@ -14,6 +14,7 @@ from lutris.services import SERVICES
 from lutris.util.game_finder import find_linux_game_executable, find_windows_game_executable
 from lutris.util.gog import convert_gog_config_to_lutris, get_gog_config_from_path, get_gog_game_path
 from lutris.util.log import logger
+from lutris.util.strings import gtk_safe
 
 
 class LutrisInstaller:  # pylint: disable=too-many-instance-attributes
@@ -29,6 +30,7 @@ class LutrisInstaller:  # pylint: disable=too-many-instance-attributes
         self.runner = installer["runner"]
         self.script = installer.get("script")
         self.game_name = installer["name"]
+        self.safe_game_name = gtk_safe(self.game_name)
         self.game_slug = installer["game_slug"]
         self.service = self.get_service(initial=service)
         self.service_appid = self.get_appid(installer, initial=appid)
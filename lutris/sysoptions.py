@@ -1,13 +1,19 @@
 """Options list for system config."""
-import glob
+import concurrent.futures
 import os
+import re
 import subprocess
-from collections import OrderedDict, defaultdict
+import threading
+from collections import defaultdict
+from functools import lru_cache
 from gettext import gettext as _
+from types import MappingProxyType
 
 from lutris import runners
 from lutris.util import linux, system
 from lutris.util.display import DISPLAY_MANAGER, SCREEN_SAVER_INHIBITOR, USE_DRI_PRIME
+from lutris.util.graphics import drivers
+from lutris.util.log import logger
 
 VULKAN_DATA_DIRS = [
     "/usr/local/etc/vulkan",  # standard site-local location
@@ -18,6 +24,38 @@ VULKAN_DATA_DIRS = [
     "/usr/lib/i386-linux-gnu/GL/vulkan",  # Flatpak GL32 extension
     "/opt/amdgpu-pro/etc/vulkan"  # AMD GPU Pro - TkG
 ]
+# Most systems only have a few of these, skip the missing ones once and for all
+_VULKAN_ICD_DIRS = tuple(
+    icd_dir for icd_dir in (os.path.join(data_dir, "icd.d") for data_dir in VULKAN_DATA_DIRS)
+    if os.path.isdir(icd_dir)
+)
+# Vulkan ICD file names start with their driver, the AMDGPU-PRO check must come before AMDVLK
+ICD_NAME_REGEX = re.compile(
+    r"(?P<amdradv>radeon)|(?P<nvidia>nvidia)|(?P<intel>intel)|(?P<amdvlkpro>amd.*pro)|(?P<amdvlk>amd)",
+    re.IGNORECASE
+)
+
+_DISPLAY_SERVER = linux.LINUX_SYSTEM.display_server
+
+# Executables looked up by the options below, they are not expected to change while Lutris runs
+_find_executable = lru_cache(maxsize=64)(system.find_executable)
+
+
+def N_(message):  # pylint: disable=invalid-name
+    """Mark a string for translation, it gets translated when displayed"""
+    return message
+
+
+@lru_cache(maxsize=1)
+def is_gamescope_available():
+    """Return whether gamescope is installed and supported by the graphics driver"""
+    return bool(_find_executable("gamescope")) and linux.LINUX_SYSTEM.nvidia_gamescope_support()
+
+
+@lru_cache(maxsize=1)
+def is_gamemode_available():
+    """Return whether Feral GameMode is available"""
+    return linux.LINUX_SYSTEM.gamemode_available()
 
 
 def get_resolution_choices():
@@ -52,64 +90,105 @@ def get_output_list():
     return choices
 
 
+@lru_cache(maxsize=1)
 def get_optirun_choices():
     """Return menu choices (label, value) for Optimus"""
     choices = [(_("Off"), "off")]
-    if system.find_executable("primusrun"):
+    if _find_executable("primusrun"):
         choices.append(("primusrun", "primusrun"))
-    if system.find_executable("optirun"):
+    if _find_executable("optirun"):
         choices.append(("optirun/virtualgl", "optirun"))
-    if system.find_executable("pvkrun"):
+    if _find_executable("pvkrun"):
         choices.append(("primus vk", "pvkrun"))
     return choices
 
 
-def get_gpu_vendor_cmd(is_nvidia):
-    """Run glxinfo command to get vendor based on certain conditions"""
+@lru_cache(maxsize=1)
+def get_gpu_vendor(is_nvidia):
+    """Return the vendor of the GPU used by games"""
+    return get_sysfs_gpu_vendor(is_nvidia) or get_glxinfo_gpu_vendor(is_nvidia)
+
+
+def get_sysfs_gpu_vendor(is_nvidia):
+    """Return the vendor of the GPU used by games from the PCI IDs in /sys"""
+    gpus = [(drivers.get_gpu_vendor(card), drivers.is_boot_vga(card)) for card in drivers.get_gpus()]
+    vendors = [vendor for vendor, _boot_vga in gpus if vendor]
+    if not vendors:
+        return ""
+    if is_nvidia and "NVIDIA" in vendors:
+        return "NVIDIA"
+    for vendor, boot_vga in gpus:
+        # With DRI_PRIME, games run on the GPU that isn't driving the boot display
+        if vendor and boot_vga != USE_DRI_PRIME:
+            return vendor
+    return vendors[0]
+
+
+def get_glxinfo_gpu_vendor(is_nvidia):
+    """Return the OpenGL vendor reported by glxinfo for the GPU used by games"""
+    env = os.environ.copy()
     if is_nvidia:
-        return "__GLX_VENDOR_LIBRARY_NAME=nvidia glxinfo | grep -i opengl | grep -i vendor"
-    if USE_DRI_PRIME:
-        return "DRI_PRIME=1 glxinfo | grep -i opengl | grep -i vendor"
-    return "glxinfo | grep -i opengl | grep -i vendor"
+        env["__GLX_VENDOR_LIBRARY_NAME"] = "nvidia"
+    elif USE_DRI_PRIME:
+        env["DRI_PRIME"] = "1"
+    try:
+        glxinfo = subprocess.run(
+            ["glxinfo", "-B"],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=False,
+            timeout=5
+        )
+    except (OSError, subprocess.TimeoutExpired) as ex:
+        logger.error("Unable to run glxinfo: %s", ex)
+        return ""
+    for line in glxinfo.stdout.splitlines():
+        if line.startswith(b"OpenGL vendor string:"):
+            return line.split(b":", 1)[1].strip().decode("utf-8", errors="ignore")
+    return ""
 
 
+def scan_icd_dir(path):
+    """Return the Vulkan ICD loaders of an icd.d directory as (type, path) tuples"""
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return []
+    dir_loaders = []
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            icd_match = ICD_NAME_REGEX.match(entry.name)
+            if not icd_match or not entry.is_file():
+                continue
+            icd_type = icd_match.lastgroup
+            if icd_type == "amdvlk" and "amdgpu-pro" in path:
+                # AMDGPU-PRO ships its loader as amd_icd*.json too
+                icd_type = "amdvlkpro"
+            dir_loaders.append((icd_type, entry.path))
+    return dir_loaders
+
+
+@lru_cache(maxsize=1)
 def get_vk_icd_choices():
     """Return available Vulkan ICD loaders"""
-    intel = []
-    amdradv = []
-    nvidia = []
-    amdvlk = []
-    amdvlkpro = []
+    loaders = defaultdict(list)
     choices = [(_("Auto: WARNING -- No Vulkan Loader detected!"), "")]
-    icd_files = defaultdict(list)
     # Add loaders
-    for data_dir in VULKAN_DATA_DIRS:
-        path = os.path.join(data_dir, "icd.d", "*.json")
-        for loader in glob.glob(path):
-            icd_key = os.path.basename(loader).split(".")[0]
-            icd_files[icd_key].append(os.path.join(path, loader))
-            if "intel" in loader:
-                intel.append(loader)
-            elif "radeon" in loader:
-                amdradv.append(loader)
-            elif "nvidia" in loader:
-                nvidia.append(loader)
-            elif "amd" in loader:
-                if "pro" in loader:
-                    amdvlkpro.append(loader)
-                else:
-                    amdvlk.append(loader)
-
-    intel_files = ":".join(intel)
-    amdradv_files = ":".join(amdradv)
-    nvidia_files = ":".join(nvidia)
-    amdvlk_files = ":".join(amdvlk)
-    amdvlkpro_files = ":".join(amdvlkpro)
-
-    glxinfocmd = get_gpu_vendor_cmd(bool(nvidia_files))
-    with subprocess.Popen(glxinfocmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as glxvendorget:
-        glxvendor = glxvendorget.communicate()[0].decode("utf-8")
-    default_gpu = glxvendor
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        for dir_loaders in executor.map(scan_icd_dir, _VULKAN_ICD_DIRS):
+            for icd_type, loader in dir_loaders:
+                loaders[icd_type].append(loader)
+
+    default_gpu = get_gpu_vendor(bool(loaders["nvidia"]))
+
+    intel_files = ":".join(loaders["intel"])
+    amdradv_files = ":".join(loaders["amdradv"])
+    nvidia_files = ":".join(loaders["nvidia"])
+    amdvlk_files = ":".join(loaders["amdvlk"])
+    amdvlkpro_files = ":".join(loaders["amdvlkpro"])
 
     if "Intel" in default_gpu:
         choices = [(_("Auto: Intel Open Source (MESA: ANV)"), intel_files)]
@@ -134,392 +213,414 @@ def get_vk_icd_choices():
     return choices
 
 
+# Detecting the Vulkan ICDs scans the disk and may run glxinfo, start it now so it doesn't hold up the startup
+_VK_ICD_DETECTION = threading.Thread(target=get_vk_icd_choices, daemon=True)
+_VK_ICD_DETECTION.start()
+
+
+def get_vk_icd_default():
+    """Return the default Vulkan ICD loader, once detection is done"""
+    _VK_ICD_DETECTION.join(timeout=10)
+    return get_vk_icd_choices()[0][1]
+
+
 system_options = [  # pylint: disable=invalid-name
     {
         "option": "game_path",
         "type": "directory_chooser",
-        "label": _("Default installation folder"),
+        "label": N_("Default installation folder"),
         "default": os.path.expanduser("~/Games"),
         "scope": ["runner", "system"],
-        "help": _("The default folder where you install your games.")
+        "help": N_("The default folder where you install your games.")
     },
     {
-        "option":
-        "disable_runtime",
-        "type":
-        "bool",
-        "label":
-        _("Disable Lutris Runtime"),
-        "default":
-        False,
-        "help": _("The Lutris Runtime loads some libraries before running the "
-                  "game, which can cause some incompatibilities in some cases. "
-                  "Check this option to disable it."),
+        "option": "disable_runtime",
+        "type": "bool",
+        "label": N_("Disable Lutris Runtime"),
+        "default": False,
+        "help": N_("The Lutris Runtime loads some libraries before running the "
+                   "game, which can cause some incompatibilities in some cases. "
+                   "Check this option to disable it."),
     },
     {
         "option": "prefer_system_libs",
         "type": "bool",
-        "label": _("Prefer system libraries"),
+        "label": N_("Prefer system libraries"),
         "default": True,
-        "help": _("When the runtime is enabled, prioritize the system libraries"
-                  " over the provided ones."),
+        "help": N_("When the runtime is enabled, prioritize the system libraries"
+                   " over the provided ones."),
     },
     {
         "option": "reset_desktop",
         "type": "bool",
-        "label": _("Restore resolution on game exit"),
+        "label": N_("Restore resolution on game exit"),
         "default": False,
-        "help": _("Some games don't restore your screen resolution when \n"
-                  "closed or when they crash. This is when this option comes \n"
-                  "into play to save your bacon."),
+        "help": N_("Some games don't restore your screen resolution when \n"
+                   "closed or when they crash. This is when this option comes \n"
+                   "into play to save your bacon."),
     },
     {
         "option": "gamescope",
         "type": "bool",
-        "label": _("Enable gamescope"),
+        "label": N_("Enable gamescope"),
         "default": False,
         "advanced": True,
-        "condition": bool(system.find_executable("gamescope")) and linux.LINUX_SYSTEM.nvidia_gamescope_support(),
-        "help": _("Use gamescope to draw the game window isolated from your desktop.\n"
-                  "Use Ctrl+Super+F to toggle fullscreen"),
+        "condition": is_gamescope_available,
+        "help": N_("Use gamescope to draw the game window isolated from your desktop.\n"
+                   "Use Ctrl+Super+F to toggle fullscreen"),
     },
     {
         "option": "gamescope_output_res",
         "type": "string",
-        "label": _("Gamescope output resolution"),
+        "label": N_("Gamescope output resolution"),
         "default": False,
         "advanced": True,
-        "condition": bool(system.find_executable("gamescope")),
-        "help": _("Resolution of the window on your desktop"),
+        "condition": lambda: bool(_find_executable("gamescope")),
+        "help": N_("Resolution of the window on your desktop"),
     },
     {
         "option": "gamescope_game_res",
         "type": "string",
-        "label": _("Gamescope game resolution"),
+        "label": N_("Gamescope game resolution"),
         "default": False,
         "advanced": True,
-        "condition": bool(system.find_executable("gamescope")),
-        "help": _("Resolution of the screen visible to the game"),
+        "condition": lambda: bool(_find_executable("gamescope")),
+        "help": N_("Resolution of the screen visible to the game"),
     },
     {
         "option": "single_cpu",
         "type": "bool",
-        "label": _("Restrict number of cores used"),
+        "label": N_("Restrict number of cores used"),
         "advanced": True,
         "default": False,
-        "help": _("Restrict the game to a maximum number of CPU cores."),
+        "help": N_("Restrict the game to a maximum number of CPU cores."),
     },
     {
         "option": "limit_cpu_count",
         "type": "string",
-        "label": _("Restrict number of cores to"),
+        "label": N_("Restrict number of cores to"),
         "advanced": True,
         "default": "1",
-        "help": _("Maximum number of CPU cores to be used, if 'Restrict number of cores used' is turned on."),
+        "help": N_("Maximum number of CPU cores to be used, if 'Restrict number of cores used' is turned on."),
     },
     {
         "option": "restore_gamma",
         "type": "bool",
         "default": False,
-        "label": _("Restore gamma on game exit"),
+        "label": N_("Restore gamma on game exit"),
         "advanced": True,
-        "help": _("Some games don't correctly restores gamma on exit, making "
-                  "your display too bright. Select this option to correct it."),
+        "help": N_("Some games don't correctly restores gamma on exit, making "
+                   "your display too bright. Select this option to correct it."),
     },
     {
         "option": "disable_compositor",
-        "label": _("Disable desktop effects"),
+        "label": N_("Disable desktop effects"),
         "type": "bool",
         "default": False,
         "advanced": True,
-        "help": _("Disable desktop effects while game is running, "
-                  "reducing stuttering and increasing performance"),
+        "help": N_("Disable desktop effects while game is running, "
+                   "reducing stuttering and increasing performance"),
     },
     {
         "option": "disable_screen_saver",
-        "label": _("Disable screen saver"),
+        "label": N_("Disable screen saver"),
         "type": "bool",
         "default": SCREEN_SAVER_INHIBITOR is not None,
         "advanced": False,
         "condition": SCREEN_SAVER_INHIBITOR is not None,
-        "help": _("Disable the screen saver while a game is running. "
-                  "Requires the screen saver's functionality "
-                  "to be exposed over DBus."),
+        "help": N_("Disable the screen saver while a game is running. "
+                   "Requires the screen saver's functionality "
+                   "to be exposed over DBus."),
     },
     {
         "option": "reset_pulse",
         "type": "bool",
-        "label": _("Reset PulseAudio"),
+        "label": N_("Reset PulseAudio"),
         "default": False,
         "advanced": True,
-        "condition": system.find_executable("pulseaudio"),
-        "help": _("Restart PulseAudio before launching the game."),
+        "condition": lambda: bool(_find_executable("pulseaudio")),
+        "help": N_("Restart PulseAudio before launching the game."),
     },
     {
         "option": "pulse_latency",
         "type": "bool",
-        "label": _("Reduce PulseAudio latency"),
+        "label": N_("Reduce PulseAudio latency"),
         "default": False,
         "advanced": True,
-        "condition": system.find_executable("pulseaudio") or system.find_executable("pipewire-pulse"),
-        "help": _("Set the environment variable PULSE_LATENCY_MSEC=60 "
-                  "to improve audio quality on some games"),
+        "condition": lambda: bool(_find_executable("pulseaudio") or _find_executable("pipewire-pulse")),
+        "help": N_("Set the environment variable PULSE_LATENCY_MSEC=60 "
+                   "to improve audio quality on some games"),
     },
     {
         "option": "use_us_layout",
         "type": "bool",
-        "label": _("Switch to US keyboard layout"),
+        "label": N_("Switch to US keyboard layout"),
         "default": False,
         "advanced": True,
-        "help": _("Switch to US keyboard QWERTY layout while game is running"),
+        "help": N_("Switch to US keyboard QWERTY layout while game is running"),
     },
     {
         "option": "optimus",
         "type": "choice",
         "default": "off",
         "choices": get_optirun_choices,
-        "label": _("Optimus launcher (NVIDIA Optimus laptops)"),
+        "label": N_("Optimus launcher (NVIDIA Optimus laptops)"),
         "advanced": True,
-        "help": _("If you have installed the primus or bumblebee packages, "
-                  "select what launcher will run the game with the command, "
-                  "activating your NVIDIA graphic chip for high 3D "
-                  "performance. primusrun normally has better performance, but"
-                  "optirun/virtualgl works better for more games."
-                  "Primus VK provide vulkan support under bumblebee."),
+        "help": N_("If you have installed the primus or bumblebee packages, "
+                   "select what launcher will run the game with the command, "
+                   "activating your NVIDIA graphic chip for high 3D "
+                   "performance. primusrun normally has better performance, but"
+                   "optirun/virtualgl works better for more games."
+                   "Primus VK provide vulkan support under bumblebee."),
     },
     {
         "option": "vk_icd",
         "type": "choice",
-        "default": get_vk_icd_choices()[0][1],
+        "default": get_vk_icd_default,
         "choices": get_vk_icd_choices,
-        "label": _("Vulkan ICD loader"),
+        "label": N_("Vulkan ICD loader"),
         "advanced": True,
-        "help": _("The ICD loader is a library that is placed between a Vulkan "
-                  "application and any number of Vulkan drivers, in order to support "
-                  "multiple drivers and the instance-level functionality that works "
-                  "across these drivers.")
+        "help": N_("The ICD loader is a library that is placed between a Vulkan "
+                   "application and any number of Vulkan drivers, in order to support "
+                   "multiple drivers and the instance-level functionality that works "
+                   "across these drivers.")
     },
     {
         "option": "mangohud",
         "type": "bool",
-        "label": _("FPS counter (MangoHud)"),
+        "label": N_("FPS counter (MangoHud)"),
         "default": False,
-        "condition": bool(system.find_executable("mangohud")),
-        "help": _("Display the game's FPS + other information. Requires MangoHud to be installed."),
+        "condition": lambda: bool(_find_executable("mangohud")),
+        "help": N_("Display the game's FPS + other information. Requires MangoHud to be installed."),
     },
     {
         "option": "fps_limit",
         "type": "string",
         "size": "small",
-        "label": _("FPS limit"),
+        "label": N_("FPS limit"),
         "advanced": True,
-        "condition": bool(system.find_executable("strangle")),
-        "help": _("Limit the game's FPS to desired number"),
+        "condition": lambda: bool(_find_executable("strangle")),
+        "help": N_("Limit the game's FPS to desired number"),
     },
     {
         "option": "gamemode",
         "type": "bool",
-        "default": linux.LINUX_SYSTEM.gamemode_available(),
-        "condition": linux.LINUX_SYSTEM.gamemode_available(),
-        "label": _("Enable Feral GameMode"),
-        "help": _("Request a set of optimisations be temporarily applied to the host OS"),
+        "default": is_gamemode_available,
+        "condition": is_gamemode_available,
+        "label": N_("Enable Feral GameMode"),
+        "help": N_("Request a set of optimisations be temporarily applied to the host OS"),
     },
     {
         "option": "prime",
         "type": "bool",
         "default": False,
         "condition": True,
-        "label": _("Enable NVIDIA Prime Render Offload"),
-        "help": _("If you have the latest NVIDIA driver and the properly patched xorg-server (see "
-                  "https://download.nvidia.com/XFree86/Linux-x86_64/435.17/README/primerenderoffload.html"
-                  "), you can launch a game on your NVIDIA GPU by toggling this switch. This will apply "
-                  "__NV_PRIME_RENDER_OFFLOAD=1 and "
-                  "__GLX_VENDOR_LIBRARY_NAME=nvidia environment variables.")
+        "label": N_("Enable NVIDIA Prime Render Offload"),
+        "help": N_("If you have the latest NVIDIA driver and the properly patched xorg-server (see "
+                   "https://download.nvidia.com/XFree86/Linux-x86_64/435.17/README/primerenderoffload.html"
+                   "), you can launch a game on your NVIDIA GPU by toggling this switch. This will apply "
+                   "__NV_PRIME_RENDER_OFFLOAD=1 and "
+                   "__GLX_VENDOR_LIBRARY_NAME=nvidia environment variables.")
     },
     {
         "option": "dri_prime",
         "type": "bool",
         "default": USE_DRI_PRIME,
         "condition": USE_DRI_PRIME,
-        "label": _("Use discrete graphics"),
+        "label": N_("Use discrete graphics"),
         "advanced": True,
-        "help": _("If you have open source graphic drivers (Mesa), selecting this "
-                  "option will run the game with the 'DRI_PRIME=1' environment variable, "
-                  "activating your discrete graphic chip for high 3D "
-                  "performance."),
+        "help": N_("If you have open source graphic drivers (Mesa), selecting this "
+                   "option will run the game with the 'DRI_PRIME=1' environment variable, "
+                   "activating your discrete graphic chip for high 3D "
+                   "performance."),
     },
     {
         "option": "sdl_video_fullscreen",
         "type": "choice",
-        "label": _("SDL 1.2 Fullscreen Monitor"),
+        "label": N_("SDL 1.2 Fullscreen Monitor"),
         "choices": get_output_list,
         "default": "off",
         "advanced": True,
-        "help": _("Hint SDL 1.2 games to use a specific monitor when going "
-                  "fullscreen by setting the SDL_VIDEO_FULLSCREEN "
-                  "environment variable"),
+        "help": N_("Hint SDL 1.2 games to use a specific monitor when going "
+                   "fullscreen by setting the SDL_VIDEO_FULLSCREEN "
+                   "environment variable"),
     },
     {
         "option": "display",
         "type": "choice",
-        "label": _("Turn off monitors except"),
+        "label": N_("Turn off monitors except"),
         "choices": get_output_choices,
-        "condition": linux.LINUX_SYSTEM.display_server != "wayland",
+        "condition": _DISPLAY_SERVER != "wayland",
         "default": "off",
         "advanced": True,
-        "help": _("Only keep the selected screen active while the game is "
-                  "running. \n"
-                  "This is useful if you have a dual-screen setup, and are \n"
-                  "having display issues when running a game in fullscreen."),
+        "help": N_("Only keep the selected screen active while the game is "
+                   "running. \n"
+                   "This is useful if you have a dual-screen setup, and are \n"
+                   "having display issues when running a game in fullscreen."),
     },
     {
         "option": "resolution",
         "type": "choice",
-        "label": _("Switch resolution to"),
+        "label": N_("Switch resolution to"),
         "choices": get_resolution_choices,
-        "condition": linux.LINUX_SYSTEM.display_server != "wayland",
+        "condition": _DISPLAY_SERVER != "wayland",
         "default": "off",
-        "help": _("Switch to this screen resolution while the game is running."),
+        "help": N_("Switch to this screen resolution while the game is running."),
     },
     {
         "option": "terminal",
-        "label": _("CLI mode"),
+        "label": N_("CLI mode"),
         "type": "bool",
         "default": False,
         "advanced": True,
-        "help": _("Enable a terminal for text-based games. "
-                  "Only useful for ASCII based games. May cause issues with graphical games."),
+        "help": N_("Enable a terminal for text-based games. "
+                   "Only useful for ASCII based games. May cause issues with graphical games."),
     },
     {
         "option": "terminal_app",
-        "label": _("Text based games emulator"),
+        "label": N_("Text based games emulator"),
         "type": "choice_with_entry",
         "choices": linux.get_terminal_apps,
         "default": linux.get_default_terminal(),
         "advanced": True,
-        "help": _("The terminal emulator used with the CLI mode. "
-                  "Choose from the list of detected terminal apps or enter "
-                  "the terminal's command or path."),
+        "help": N_("The terminal emulator used with the CLI mode. "
+                   "Choose from the list of detected terminal apps or enter "
+                   "the terminal's command or path."),
     },
     {
         "option": "env",
         "type": "mapping",
-        "label": _("Environment variables"),
-        "help": _("Environment variables loaded at run time"),
+        "label": N_("Environment variables"),
+        "help": N_("Environment variables loaded at run time"),
     },
     {
         "option": "antimicro_config",
         "type": "file",
-        "label": _("AntiMicroX Profile"),
+        "label": N_("AntiMicroX Profile"),
         "advanced": True,
-        "help": _("Path to an AntiMicroX profile file"),
+        "help": N_("Path to an AntiMicroX profile file"),
     },
     {
         "option": "prefix_command",
         "type": "string",
-        "label": _("Command prefix"),
+        "label": N_("Command prefix"),
         "advanced": True,
-        "help": _("Command line instructions to add in front of the game's "
-                  "execution command."),
+        "help": N_("Command line instructions to add in front of the game's "
+                   "execution command."),
     },
     {
         "option": "manual_command",
         "type": "file",
-        "label": _("Manual script"),
+        "label": N_("Manual script"),
         "advanced": True,
-        "help": _("Script to execute from the game's contextual menu"),
+        "help": N_("Script to execute from the game's contextual menu"),
     },
     {
         "option": "prelaunch_command",
         "type": "file",
-        "label": _("Pre-launch script"),
+        "label": N_("Pre-launch script"),
         "advanced": True,
-        "help": _("Script to execute before the game starts"),
+        "help": N_("Script to execute before the game starts"),
     },
     {
         "option": "prelaunch_wait",
         "type": "bool",
-        "label": _("Wait for pre-launch script completion"),
+        "label": N_("Wait for pre-launch script completion"),
         "advanced": True,
         "default": False,
-        "help": _("Run the game only once the pre-launch script has exited"),
+        "help": N_("Run the game only once the pre-launch script has exited"),
     },
     {
         "option": "postexit_command",
         "type": "file",
-        "label": _("Post-exit script"),
+        "label": N_("Post-exit script"),
         "advanced": True,
-        "help": _("Script to execute when the game exits"),
+        "help": N_("Script to execute when the game exits"),
     },
     {
         "option": "include_processes",
         "type": "string",
-        "label": _("Include processes"),
+        "label": N_("Include processes"),
         "advanced": True,
-        "help": _("What processes to include in process monitoring. "
-                  "This is to override the built-in exclude list.\n"
-                  "Space-separated list, processes including spaces "
-                  "can be wrapped in quotation marks."),
+        "help": N_("What processes to include in process monitoring. "
+                   "This is to override the built-in exclude list.\n"
+                   "Space-separated list, processes including spaces "
+                   "can be wrapped in quotation marks."),
     },
     {
         "option": "exclude_processes",
         "type": "string",
-        "label": _("Exclude processes"),
+        "label": N_("Exclude processes"),
         "advanced": True,
-        "help": _("What processes to exclude in process monitoring. "
-                  "For example background processes that stick around "
-                  "after the game has been closed.\n"
-                  "Space-separated list, processes including spaces "
-                  "can be wrapped in quotation marks."),
+        "help": N_("What processes to exclude in process monitoring. "
+                   "For example background processes that stick around "
+                   "after the game has been closed.\n"
+                   "Space-separated list, processes including spaces "
+                   "can be wrapped in quotation marks."),
     },
     {
         "option": "killswitch",
         "type": "string",
-        "label": _("Killswitch file"),
+        "label": N_("Killswitch file"),
         "advanced": True,
-        "help": _("Path to a file which will stop the game when deleted \n"
-                  "(usually /dev/input/js0 to stop the game on joystick "
-                  "unplugging)"),
+        "help": N_("Path to a file which will stop the game when deleted \n"
+                   "(usually /dev/input/js0 to stop the game on joystick "
+                   "unplugging)"),
     },
     {
         "option": "sdl_gamecontrollerconfig",
         "type": "string",
-        "label": _("SDL2 gamepad mapping"),
+        "label": N_("SDL2 gamepad mapping"),
         "advanced": True,
-        "help": _("SDL_GAMECONTROLLERCONFIG mapping string or path to a custom "
-                  "gamecontrollerdb.txt file containing mappings."),
+        "help": N_("SDL_GAMECONTROLLERCONFIG mapping string or path to a custom "
+                   "gamecontrollerdb.txt file containing mappings."),
     },
     {
         "option": "xephyr",
-        "label": _("Use Xephyr"),
+        "label": N_("Use Xephyr"),
         "type": "choice",
         "choices": (
-            (_("Off"), "off"),
-            (_("8BPP (256 colors)"), "8bpp"),
-            (_("16BPP (65536 colors)"), "16bpp"),
-            (_("24BPP (16M colors)"), "24bpp"),
+            (N_("Off"), "off"),
+            (N_("8BPP (256 colors)"), "8bpp"),
+            (N_("16BPP (65536 colors)"), "16bpp"),
+            (N_("24BPP (16M colors)"), "24bpp"),
         ),
         "default": "off",
         "advanced": True,
-        "help": _("Run program in Xephyr to support 8BPP and 16BPP color modes"),
+        "help": N_("Run program in Xephyr to support 8BPP and 16BPP color modes"),
     },
     {
         "option": "xephyr_resolution",
         "type": "string",
-        "label": _("Xephyr resolution"),
+        "label": N_("Xephyr resolution"),
         "advanced": True,
-        "help": _("Screen resolution of the Xephyr server"),
+        "help": N_("Screen resolution of the Xephyr server"),
     },
     {
         "option": "xephyr_fullscreen",
         "type": "bool",
-        "label": _("Xephyr Fullscreen"),
+        "label": N_("Xephyr Fullscreen"),
         "default": True,
         "advanced": True,
-        "help": _("Open Xephyr in fullscreen (at the desktop resolution)"),
+        "help": N_("Open Xephyr in fullscreen (at the desktop resolution)"),
     },
 ]
 
+# The options are shared by every configuration, they must not be changed in place
+system_options = tuple(MappingProxyType(option) for option in system_options)  # pylint: disable=invalid-name
+_OPTION_INDEXES = {option["option"]: index for index, option in enumerate(system_options)}
+
+
+def translate_option(option):
+    """Return a copy of a system option with its label, help text and fixed choices translated"""
+    translated_option = dict(option)
+    for key in ("label", "help"):
+        if translated_option.get(key):
+            translated_option[key] = _(translated_option[key])
+    if isinstance(translated_option.get("choices"), (list, tuple)):
+        translated_option["choices"] = [(_(label), value) for label, value in translated_option["choices"]]
+    return translated_option
+
 
 def with_runner_overrides(runner_slug):
     """Return system options updated with overrides from given runner."""
@@ -531,13 +632,11 @@ def with_runner_overrides(runner_slug):
     if not getattr(runner, "system_options_override"):
         runner = runner()
     if runner.system_options_override:
-        opts_dict = OrderedDict((opt["option"], opt) for opt in options)
+        options = list(options)
         for option in runner.system_options_override:
-            key = option["option"]
-            if opts_dict.get(key):
-                opts_dict[key] = opts_dict[key].copy()
-                opts_dict[key].update(option)
+            index = _OPTION_INDEXES.get(option["option"])
+            if index is None:
+                options.append(option)
             else:
-                opts_dict[key] = option
-        options = list(opts_dict.values())
+                options[index] = {**options[index], **option}
     return options
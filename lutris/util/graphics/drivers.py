@@ -11,6 +11,13 @@ from lutris.util.log import logger
 
 MIN_RECOMMENDED_NVIDIA_DRIVER = 415
 
+# PCI vendor IDs of the GPU makers, as found in /sys/class/drm/card*/device/vendor
+GPU_VENDORS = {
+    "0x8086": "Intel",
+    "0x1002": "AMD",
+    "0x10de": "NVIDIA",
+}
+
 
 def get_nvidia_driver_info():
     """Return information about NVidia drivers"""
@@ -86,6 +93,25 @@ def get_gpu_info(card):
     return infos
 
 
+def get_gpu_vendor(card):
+    """Return the vendor name of a GPU, or an empty string if it's not a known one"""
+    try:
+        with open("/sys/class/drm/%s/device/vendor" % card, encoding='utf-8') as vendor_file:
+            vendor_id = vendor_file.read().strip()
+    except OSError:
+        return ""
+    return GPU_VENDORS.get(vendor_id, "")
+
+
+def is_boot_vga(card):
+    """Return true if the GPU is the one the system booted on"""
+    try:
+        with open("/sys/class/drm/%s/device/boot_vga" % card, encoding='utf-8') as boot_vga_file:
+            return boot_vga_file.read().strip() == "1"
+    except OSError:
+        return False
+
+
 def is_amd():
     """Return true if the system uses the AMD driver"""
     for card in get_gpus():
@@ -10,6 +10,10 @@ import uuid
 from lutris.util.log import logger
 
 NO_PLAYTIME = "Never played"
+URL_REGEX = re.compile(
+    r"(http[s]?://("
+    r"?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+)"
+)
 
 
 def slugify(value):
@@ -37,12 +41,7 @@ def slugify(value):
 
 def add_url_tags(text):
     """Surround URL with <a> tags."""
-    return re.sub(
-        r"(http[s]?://("
-        r"?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+)",
-        r'<a href="\1">\1</a>',
-        text,
-    )
+    return URL_REGEX.sub(r'<a href="\1">\1</a>', text)
 
 
 def lookup_string_in_text(string, text):
@@ -3,7 +3,7 @@ from unittest.mock import patch
 
 from test_pga import DatabaseTester
 
-from lutris import runners
+from lutris import runners, sysoptions
 from lutris.config import LutrisConfig
 from lutris.util.test_config import setup_test_environment
 
@@ -36,6 +36,15 @@ class ImportRunnerTest(DatabaseTester):
                 self.assertIn('type', option)
                 self.assertFalse(option['type'] == 'single')
 
+    def test_system_options_override(self):
+        options = sysoptions.with_runner_overrides('steam')
+        self.assertEqual(len(options), len(sysoptions.system_options))
+        disable_runtime = [opt for opt in options if opt['option'] == 'disable_runtime'][0]
+        self.assertTrue(disable_runtime['default'])
+        self.assertEqual(disable_runtime['type'], 'bool')
+        system_disable_runtime = [opt for opt in sysoptions.system_options if opt['option'] == 'disable_runtime'][0]
+        self.assertFalse(system_disable_runtime['default'])
+
     def test_get_system_config(self):
         def fake_yaml_reader(path):
             if not path: